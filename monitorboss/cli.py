@@ -1,11 +1,12 @@
 from argparse import ArgumentParser
-from collections.abc import Sequence
+from collections.abc import Callable, Sequence
+from functools import lru_cache
 from logging import getLogger, DEBUG
 from time import sleep
 
 from monitorboss import MonitorBossError, indentation
 from monitorboss.config import Config, get_config
-from monitorboss.impl import list_monitors, get_feature, set_feature, toggle_feature, get_vcp_capabilities
+from monitorboss.impl import list_monitors, clear_monitor_cache, get_monitor, get_feature, set_feature, toggle_feature, get_vcp_capabilities
 from monitorboss.info import feature_data, monitor_data, value_data, capability_data, capability_summary_data
 from monitorboss.output import caps_raw_output, caps_parsed_output, list_mons_output, \
     get_feature_output, set_feature_output, tog_feature_output
@@ -15,28 +16,34 @@ from pyddc.vcp_codes import VCPCodes, VCPCommand
 _log = getLogger(__name__)
 _INDENT_LEVEL = 4 if _log.level >= DEBUG else None
 
+_CODE_TO_COM: dict[int, VCPCommand] = {code.value: get_vcp_com(code.value) for code in VCPCodes}
+_NAME_TO_COM: dict[str, VCPCommand] = {com.name: com for com in _CODE_TO_COM.values()}
+
+# The parsed dict (and its Capability objects) is shared by every caller with the same string, and
+# outlives run(); callers must treat it as read-only.
+_parse_capabilities = lru_cache(maxsize=16)(parse_capabilities)
+
 
 # TODO: This does not allow for custom/OEM codes as is (for when we add such)
 def _check_feature(feature: str, cfg: Config) -> VCPCommand:
     _log.debug(f"check feature: {feature!r}")
-    if feature.isdigit():
-        for code in VCPCodes:
-            if int(feature) == code.value:
-                return get_vcp_com(code.value)
-        raise MonitorBossError(
-            f"{feature} is not a valid feature code."
-        )
+    if feature.isdecimal():
+        com = _CODE_TO_COM.get(int(feature))
+        if com is None:
+            raise MonitorBossError(
+                f"{feature} is not a valid feature code."
+            )
+        return com
     else:
-        for alias, code in cfg.feature_aliases.items():
-            if alias == feature:
-                return get_vcp_com(code)
-        for code in VCPCodes:
-            com = get_vcp_com(code.value)
-            if com.name == feature:
-                return com
-        raise MonitorBossError(
-            f"{feature} is not a valid feature alias."
-        )
+        code = cfg.feature_aliases.get(feature)
+        if code is not None:
+            return get_vcp_com(code)
+        com = _NAME_TO_COM.get(feature)
+        if com is None:
+            raise MonitorBossError(
+                f"{feature} is not a valid feature alias."
+            )
+        return com
 
 
 def _check_mon(mon: str, cfg: Config) -> int:
@@ -54,25 +61,47 @@ def _check_mon(mon: str, cfg: Config) -> int:
 def _check_val(com: VCPCommand, val: str, cfg: Config) -> int:
     _log.debug(f"check feature value: ftr {com.name}, value {val}")
     # Check if input is a positive integer, and if so, just return it.
-    if val.isdigit():
+    if val.isdecimal():
         return int(val)
     # if not, we need to check for valid params and aliases...
-    else:
-        # ...so first check if there is a param name...
-        if val in com.param_names:
-            return com.param_names[val]
-        # ... and if not, check if there is a matching alias table for this feature and if so alias for this value...
-        if com.name in cfg.value_aliases and val in cfg.value_aliases[com.name]:
-            return cfg.value_aliases[com.name][val]
+    # (the feature's alias table is looked up once; features without one get an empty table)
+    params = com.param_names
+    aliases = cfg.value_aliases.get(com.name, {})
+    # ...so first check if there is a param name, and if not, check the alias table for this feature...
+    value = params.get(val, aliases.get(val))
+    if value is not None:
+        return value
     # If we got here, an invalid value was provided
-    error_text = f"{val} is not a valid value for feature \"{com.name}\".\nValid values are:\n"
-    if com.param_names:
-        error_text += f"{indentation}- [PARAM NAMES]: {', '.join(com.param_names.keys())}\n"
-    if com.name in cfg.value_aliases:
-        error_text += f"{indentation}- [CONFIG ALIASES]: {', '.join(cfg.value_aliases[com.name].keys())}\n"
-    error_text += f"{indentation}- a code number (non-negative integer)\n"
-    error_text += f"NOTE: A particular monitor may only support some of these values. Check your monitor's specs for the inputs it accepts."
-    raise MonitorBossError(error_text)
+    error_lines = [f"{val} is not a valid value for feature \"{com.name}\".", "Valid values are:"]
+    if params:
+        error_lines.append(f"{indentation}- [PARAM NAMES]: {', '.join(params.keys())}")
+    if aliases:
+        error_lines.append(f"{indentation}- [CONFIG ALIASES]: {', '.join(aliases.keys())}")
+    error_lines.append(f"{indentation}- a code number (non-negative integer)")
+    error_lines.append("NOTE: A particular monitor may only support some of these values. Check your monitor's specs for the inputs it accepts.")
+    raise MonitorBossError("\n".join(error_lines))
+
+
+def _for_each_monitor(func: Callable[[int], object], mons: list[int], wait: float, cfg: Config) -> list:
+    # Monitors are independent devices, so with the "parallel" setting their DDC transactions are run
+    # concurrently. Otherwise (or if a monitor is listed twice, since a VCP can only be opened once at
+    # a time) they are run one after the other, waiting between monitors.
+    if len(mons) == 1:
+        # the common case: nothing to wait between, and not worth spinning up a thread pool for
+        return [func(mons[0])]
+    # compare the VCPs themselves, since different indices can name the same monitor (e.g. 2 and -1)
+    # (this also enumerates once up front, rather than from every worker at once)
+    if cfg.parallel and len({id(get_monitor(m)) for m in mons}) == len(mons):
+        # imported here since it's only needed with the "parallel" setting, and is slow to import
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=len(mons)) as executor:
+            return list(executor.map(func, mons))
+    results = []
+    for i, m in enumerate(mons):
+        results.append(func(m))
+        if i + 1 < len(mons):
+            sleep(wait)
+    return results
 
 
 def _list_mons(args, cfg: Config):
@@ -83,50 +112,32 @@ def _list_mons(args, cfg: Config):
 def _get_caps(args, cfg: Config):
     _log.debug(f"get capabilities: {args}")
     mons = [_check_mon(m, cfg) for m in args.monitor]
-    rawcaps_list = []
-    for i, m in enumerate(mons):
-        rawcaps_list.append(get_vcp_capabilities(m))
+    rawcaps_list = [get_vcp_capabilities(m) for m in mons]
+    mdata_list = [monitor_data(mon, cfg) for mon in mons]
 
     if args.raw:
-        moncaps_list = []
-        for mon, caps in zip(mons, rawcaps_list):
-            mdata = monitor_data(mon, cfg)
-            moncaps_list.append((mdata, caps))
-        print(caps_raw_output(moncaps_list, args.json))
+        print(caps_raw_output(list(zip(mdata_list, rawcaps_list)), args.json))
         return
 
-    fullcaps_list = [capability_data(parse_capabilities(rawcap), cfg) for rawcap in rawcaps_list]
+    fullcaps_list = [capability_data(_parse_capabilities(rawcap), cfg) for rawcap in rawcaps_list]
 
     if args.summary:
         summarycaps_list = [capability_summary_data(fullcap) for fullcap in fullcaps_list]
-        moncaps_list = []
-        for mon, caps in zip(mons, summarycaps_list):
-            mdata = monitor_data(mon, cfg)
-            moncaps_list.append((mdata, caps))
-        print(caps_parsed_output(moncaps_list, args.json))
+        print(caps_parsed_output(list(zip(mdata_list, summarycaps_list)), args.json))
         return
 
-    moncaps_list = []
-    for mon, caps in zip(mons, fullcaps_list):
-        mdata = monitor_data(mon, cfg)
-        moncaps_list.append((mdata, caps))
-    print(caps_parsed_output(moncaps_list, args.json))
+    print(caps_parsed_output(list(zip(mdata_list, fullcaps_list)), args.json))
 
 
 def _get_feature(args, cfg: Config):
     _log.debug(f"get feature: {args}")
     vcpcom = _check_feature(args.feature, cfg)
     mons = [_check_mon(m, cfg) for m in args.monitor]
-    cur_vals = []
-    max_vals = []
-    for i, m in enumerate(mons):
-        ret = get_feature(m, vcpcom, cfg.wait_internal_time)
-        cur_vals.append(ret.value)
-        # The "max" value for discrete features actually represents the number of valid values.
-        # We don't report this to the user because there's nothing they can do with the information.
-        max_vals.append(None if vcpcom.discrete else ret.max)
-        if i + 1 < len(mons):
-            sleep(cfg.wait_get_time)
+    rets = _for_each_monitor(lambda m: get_feature(m, vcpcom, cfg.wait_internal_time), mons, cfg.wait_get_time, cfg)
+    cur_vals = [ret.value for ret in rets]
+    # The "max" value for discrete features actually represents the number of valid values.
+    # We don't report this to the user because there's nothing they can do with the information.
+    max_vals = [None if vcpcom.discrete else ret.max for ret in rets]
     monvalmax_list = []
     fdata = feature_data(vcpcom.code, cfg)
     for mon, val, maximum in zip(mons, cur_vals, max_vals):
@@ -142,12 +153,7 @@ def _set_feature(args, cfg: Config):
     vcpcom = _check_feature(args.feature, cfg)
     mons = [_check_mon(m, cfg) for m in args.monitor]
     val = _check_val(vcpcom, args.value, cfg)
-    new_vals = []
-    for i, m in enumerate(mons):
-        new_vals.append(set_feature(m, vcpcom, val, cfg.wait_internal_time))
-        if i + 1 < len(mons):
-            sleep(cfg.wait_set_time)
-    new_vals = [set_feature(m, vcpcom, val, cfg.wait_internal_time) for m in mons]
+    new_vals = _for_each_monitor(lambda m: set_feature(m, vcpcom, val, cfg.wait_internal_time), mons, cfg.wait_set_time, cfg)
     monval_list = []
     fdata = feature_data(vcpcom.code, cfg)
     for mon, new_val in zip(mons, new_vals):
@@ -164,11 +170,7 @@ def _tog_feature(args, cfg: Config):
     mons = [_check_mon(m, cfg) for m in args.monitor]
     val1 = _check_val(vcpcom, args.value1, cfg)
     val2 = _check_val(vcpcom, args.value2, cfg)
-    tog_vals = []
-    for i, m in enumerate(mons):
-        tog_vals.append(toggle_feature(m, vcpcom, val1, val2, cfg.wait_internal_time))
-        if i + 1 < len(mons):
-            sleep(cfg.wait_set_time)
+    tog_vals = _for_each_monitor(lambda m: toggle_feature(m, vcpcom, val1, val2, cfg.wait_internal_time), mons, cfg.wait_set_time, cfg)
     monvals_list = []
     fdata = feature_data(vcpcom.code, cfg)
     for mon, tog_val in zip(mons, tog_vals):
@@ -245,6 +247,7 @@ def run(args: str | Sequence[str] | None = None):
     if isinstance(args, str):
         args = args.split()
     args = parser.parse_args(args)
+    clear_monitor_cache()
     try:
         cfg = get_config(args.config)
         args.func(args, cfg)
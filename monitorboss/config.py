@@ -1,10 +1,16 @@
+from collections.abc import Callable, Mapping
+from copy import deepcopy
 from enum import Enum  # cannot use StrEnum, it's not in Python 3.10
+from functools import lru_cache
 from logging import getLogger
 from pathlib import Path
 from dataclasses import dataclass, field
 
+try:
+    import tomllib
+except ImportError:  # pragma: no cover - tomllib is not in Python 3.10
+    tomllib = None
 from tomlkit import parse, dump, document, table, TOMLDocument
-from tomlkit.items import Array, String, Trivia
 
 from monitorboss import MonitorBossError
 from pyddc import get_vcp_com
@@ -26,6 +32,14 @@ class TomlSettingsKeys(Enum):
     wait_get = "wait_get"
     wait_set = "wait_set"
     wait_internal = "wait_internal"
+    parallel = "parallel"
+
+
+def _numeric_key(key: str) -> int:
+    # TOML keys are always strings; monitor IDs, feature codes and values are converted to ints once, here
+    if not key.isdecimal():
+        raise ValueError(f"expected a numeric key, got {key!r}")
+    return int(key)
 
 
 @dataclass
@@ -36,39 +50,65 @@ class Config:
     wait_get_time: float = field(default_factory=float)
     wait_set_time: float = field(default_factory=float)
     wait_internal_time: float = field(default_factory=float)
-
-    # TODO: why are we allowing for non-numeric keys? We're also not making sure aliases are strings
-    def read(self, doc: TOMLDocument):
-        _log.debug(f"read Config from TOML doc: {doc}")
-        _log.debug(f"reading monitor aliases from TOML doc: {doc[TomlCategories.monitors.value]}")
+    parallel: bool = False
+    # reverse lookups (value -> aliases); these are derived from the tables above, never set directly
+    monitor_names_rev: dict[int, list[str]] = field(init=False, repr=False, compare=False)
+    feature_aliases_rev: dict[int, list[str]] = field(init=False, repr=False, compare=False)
+    value_aliases_rev: dict[str, dict[int, list[str]]] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self._build_reverse_lookups()
+
+    def _build_reverse_lookups(self):
+        self.monitor_names_rev = {}
+        for alias, mon in self.monitor_names.items():
+            self.monitor_names_rev.setdefault(mon, []).append(alias)
+        self.feature_aliases_rev = {}
+        for alias, code in self.feature_aliases.items():
+            self.feature_aliases_rev.setdefault(code, []).append(alias)
+        self.value_aliases_rev = {}
+        for feature_key, value_aliases in self.value_aliases.items():
+            rev = self.value_aliases_rev[feature_key] = {}
+            for alias, val in value_aliases.items():
+                rev.setdefault(val, []).append(alias)
+
+    # TODO: we're not making sure aliases are strings
+    # doc may be a tomlkit TOMLDocument or the plain dict returned by tomllib
+    def read(self, doc: Mapping):
+        # these dump whole tables, so they're formatted lazily rather than with f-strings
+        _log.debug("read Config from TOML doc: %s", doc)
+        _log.debug("reading monitor aliases from TOML doc: %s", doc[TomlCategories.monitors.value])
         for val, aliases in doc[TomlCategories.monitors.value].items():
-            if isinstance(aliases, String):
-                aliases = Array([aliases], Trivia())
+            if isinstance(aliases, str):
+                aliases = [aliases]
             for alias in aliases:
-                self.monitor_names[alias] = int(val) if val.isdigit() else val
-        _log.debug(f"reading feature aliases from TOML doc: {doc[TomlCategories.features.value]}")
+                self.monitor_names[alias] = _numeric_key(val)
+        _log.debug("reading feature aliases from TOML doc: %s", doc[TomlCategories.features.value])
         for val, aliases in doc[TomlCategories.features.value].items():
-            if isinstance(aliases, String):
-                aliases = Array([aliases], Trivia())
+            if isinstance(aliases, str):
+                aliases = [aliases]
             for alias in aliases:
-                self.feature_aliases[alias] = int(val) if val.isdigit else val
-        _log.debug(f"reading feature keys for value aliases from TOML doc: {doc[TomlCategories.values.value]}")
+                self.feature_aliases[alias] = _numeric_key(val)
+        _log.debug("reading feature keys for value aliases from TOML doc: %s", doc.get(TomlCategories.values.value))
         if TomlCategories.values.value in doc.keys():
             for feature_key, alias_table in doc[TomlCategories.values.value].items():
-                _log.debug(f"determining whether table for {feature_key} contains aliases: {doc[TomlCategories.values.value][feature_key]}")
+                _log.debug("determining whether table for %s contains aliases: %s", feature_key, alias_table)
                 if alias_table:
                     _log.debug(f"copying aliases from {feature_key} value table:")
                     self.value_aliases[feature_key] = {}
                     for val, aliases in alias_table.items():
-                        if isinstance(aliases, String):
-                            aliases = Array([aliases], Trivia())
+                        if isinstance(aliases, str):
+                            aliases = [aliases]
                         for alias in aliases:
-                            self.value_aliases[feature_key][alias] = int(val) if val.isdigit else val
+                            self.value_aliases[feature_key][alias] = _numeric_key(val)
 
         self.wait_get_time = doc[TomlCategories.settings.value][TomlSettingsKeys.wait_get.value]
         self.wait_set_time = doc[TomlCategories.settings.value][TomlSettingsKeys.wait_set.value]
         self.wait_internal_time = doc[TomlCategories.settings.value][TomlSettingsKeys.wait_internal.value]
+        # optional, so that configs written before this setting existed still load
+        self.parallel = doc[TomlCategories.settings.value].get(TomlSettingsKeys.parallel.value, False)
 
+        self._build_reverse_lookups()
 
     def validate(self):
         # TODO: we should check whether assigned alliases conflict with other aliases, or an existing parameter/feature name
@@ -89,6 +129,12 @@ class Config:
             raise MonitorBossError(f"invalid wait set time: {self.wait_set_time}")
         if self.wait_internal_time < 0:
             raise MonitorBossError(f"invalid wait internal time: {self.wait_internal_time}")
+        if not isinstance(self.parallel, bool):
+            raise MonitorBossError(f"invalid parallel setting (must be true or false): {self.parallel}")
+
+
+# parsed configs keyed by absolute path; writes replace the entry with the Config that was just written
+_config_cache: dict[str, Config] = {}
 
 
 def default_toml() -> TOMLDocument:
@@ -116,6 +162,7 @@ def default_toml() -> TOMLDocument:
     settings.add(TomlSettingsKeys.wait_get.value, 0.05)
     settings.add(TomlSettingsKeys.wait_set.value, 0.1)
     settings.add(TomlSettingsKeys.wait_internal.value, 0.04)
+    settings.add(TomlSettingsKeys.parallel.value, False)
 
     doc = document()
     doc.add(TomlCategories.monitors.value, mon_names)
@@ -126,20 +173,22 @@ def default_toml() -> TOMLDocument:
     return doc
 
 
-def _read_toml(path: str | None) -> TOMLDocument:
-    path = path if path is not None else DEFAULT_CONF_FILE_LOC
-    _log.debug(f"read TOML config from: {Path(path).absolute()}")
-    if not Path(path).parent.exists():
-        Path(path).parent.mkdir(parents=True)
-    if not Path(path).exists():
-        reset_config(path)
+@lru_cache(maxsize=1)
+def _default_config() -> Config:
+    cfg = Config()
+    cfg.read(default_toml())
+    cfg.validate()
+    return cfg
+
+
+def _parse_toml_file(path: str, parser: Callable[[str], Mapping]) -> Mapping:
     try:
         with open(path, "r", encoding="utf8") as file:
             content = file.read()
     except Exception as err:
         raise MonitorBossError(f"could not read config file: {Path(path).absolute()}") from err
     try:
-        return parse(content)
+        return parser(content)
     except Exception as err:
         # TODO: add CLI options to manage the config
         raise MonitorBossError(
@@ -148,22 +197,61 @@ def _read_toml(path: str | None) -> TOMLDocument:
         ) from err
 
 
-def _write_toml(doc: TOMLDocument, path: str | None):
+def _read_toml(path: str | None) -> TOMLDocument:
+    path = path if path is not None else DEFAULT_CONF_FILE_LOC
+    _log.debug(f"read TOML config from: {Path(path).absolute()}")
+    if not Path(path).parent.exists():
+        Path(path).parent.mkdir(parents=True)
+    if not Path(path).exists():
+        reset_config(path)
+    return _parse_toml_file(path, parse)
+
+
+def _load_toml(path: str) -> Mapping:
+    # Reading a config only needs its data, not tomlkit's style-preserving document, so use the much
+    # faster stdlib parser where it exists. Writes still go through _read_toml/_write_toml.
+    if tomllib is None:  # pragma: no cover
+        return _read_toml(path)
+    _log.debug(f"load TOML config from: {Path(path).absolute()}")
+    return _parse_toml_file(path, tomllib.loads)
+
+
+def _write_toml(doc: TOMLDocument, path: str | None, cfg: Config | None = None):
     path = path if path is not None else DEFAULT_CONF_FILE_LOC
     _log.debug(f"write TOML config to: {Path(path).absolute()}")
     if not Path(path).parent.exists():
         Path(path).parent.mkdir(parents=True)
+    key = Path(path).absolute().as_posix()
+    _config_cache.pop(key, None)
     try:
         with open(path, "w", encoding="utf8") as file:
             dump(doc, file)
     except Exception as err:
         raise MonitorBossError(f"could not write config file: {Path(path).absolute()}") from err
+    # Keep the written document's Config in memory rather than reading the file back. If it doesn't
+    # parse, leave the entry out so that the next get_config reports the error.
+    try:
+        _config_cache[key] = cfg if cfg is not None else _config_from_doc(doc, path)
+    except MonitorBossError:
+        pass
 
 
 def get_config(path: str | None) -> Config:
     path = path if path is not None else DEFAULT_CONF_FILE_LOC
+    key = Path(path).absolute().as_posix()
+    if key not in _config_cache and not Path(path).exists():
+        reset_config(path)  # this also caches the default Config, so the new file isn't parsed back
+    if key not in _config_cache:
+        _config_cache[key] = _load_config(path)
+    return _config_cache[key]
+
+
+def _load_config(path: str) -> Config:
     _log.debug(f"get Config dataclass from: {Path(path).absolute()}")
-    doc = _read_toml(path)
+    return _config_from_doc(_load_toml(path), path)
+
+
+def _config_from_doc(doc: Mapping, path: str) -> Config:
     cfg = Config()
     try:
         cfg.read(doc)
@@ -221,4 +309,4 @@ def set_wait_internal_time(wait_internal_time: float, path: str | None):
 def reset_config(path: str | None):
     path = path if path is not None else DEFAULT_CONF_FILE_LOC
     _log.debug(f"reset config to default: {Path(path).absolute()}")
-    _write_toml(default_toml(), path)
+    _write_toml(default_toml(), path, deepcopy(_default_config()))
@@ -1,4 +1,6 @@
 from dataclasses import dataclass
+from enum import Enum
+from functools import lru_cache
 from logging import getLogger
 from time import sleep
 
@@ -11,8 +13,9 @@ from monitorboss.config import get_config
 _log = getLogger(__name__)
 
 
-@dataclass
+@dataclass(frozen=True)
 class FeatureData:
+    code: VCPCodes
     short_desc: str
     description: str
     notes: str
@@ -20,31 +23,34 @@ class FeatureData:
 
 # TODO: I'm not sure we need a short_desc var? Seems redundant to VCPCommand's "desc" or "name".
 #   besides, this would probably all be moved to VCPCommands once we expand to all/custom commands?
-Feature = {
-    VCPCodes.image_luminance:
-        FeatureData("luminance",
-                    "luminance/brightness",
-                    "Must be an integer, though valid values will be constrained between 0 - 100 on most monitors"),
-    VCPCodes.image_contrast:
-        FeatureData("contrast",
-                    "contrast",
-                    "Must be an integer, though valid values will be constrained between 0 - 100 on most monitors"),
-    VCPCodes.image_color_preset:
-        FeatureData("color preset",
-                    "(currently active) color preset",
-                    "Must be a valid color temperature preset, as defined by built-in aliases"),
-    VCPCodes.display_power_mode:
-        FeatureData("power mode",
-                    "power mode/state",
-                    "Must be a valid power state, as defined by built-in aliases"),
-    VCPCodes.input_source:
-        FeatureData("input source",
-                    "(currently active) input source",
-                    "Must be a valid source ID, or alias as defined by the "
-                    "application built-ins or config file additions")
-}
-
-
+class Feature(Enum):
+    image_luminance = FeatureData(VCPCodes.image_luminance,
+                                  "luminance",
+                                  "luminance/brightness",
+                                  "Must be an integer, though valid values will be constrained between 0 - 100 on most monitors")
+    image_contrast = FeatureData(VCPCodes.image_contrast,
+                                 "contrast",
+                                 "contrast",
+                                 "Must be an integer, though valid values will be constrained between 0 - 100 on most monitors")
+    image_color_preset = FeatureData(VCPCodes.image_color_preset,
+                                     "color preset",
+                                     "(currently active) color preset",
+                                     "Must be a valid color temperature preset, as defined by built-in aliases")
+    display_power_mode = FeatureData(VCPCodes.display_power_mode,
+                                     "power mode",
+                                     "power mode/state",
+                                     "Must be a valid power state, as defined by built-in aliases")
+    input_source = FeatureData(VCPCodes.input_source,
+                               "input source",
+                               "(currently active) input source",
+                               "Must be a valid source ID, or alias as defined by the "
+                               "application built-ins or config file additions")
+
+
+# Enumeration hits the OS for every VCP, so it is done once and reused until clear_monitor_cache()
+# (the CLI clears it at the start of every command, so each run still sees the current hardware).
+# Capability strings are cached by monitor index as well, so they are cleared along with it.
+@lru_cache(maxsize=1)
 def list_monitors() -> list[VCP]:
     _log.debug("list monitors")
     try:
@@ -54,6 +60,12 @@ def list_monitors() -> list[VCP]:
         raise MonitorBossError(f"Failed to list VCPs.") from err
 
 
+def clear_monitor_cache():
+    _log.debug("clear monitor cache")
+    list_monitors.cache_clear()
+    get_vcp_capabilities.cache_clear()
+
+
 def get_monitor(mon: int) -> VCP:
     _log.debug(f"get monitor: {mon}")
     monitors = list_monitors()
@@ -63,6 +75,9 @@ def get_monitor(mon: int) -> VCP:
         raise MonitorBossError(f"monitor #{mon} does not exist.") from err
 
 
+# Capability strings are slow to read and effectively static, so they are kept (keyed by monitor index)
+# for as long as the monitor list they were read from, i.e. until clear_monitor_cache().
+@lru_cache(maxsize=16)
 def get_vcp_capabilities(mon: int) -> str:
     _log.debug(f"get VCP capabilities for monitor #{mon}")
     with get_monitor(mon) as monitor:
@@ -72,31 +87,41 @@ def get_vcp_capabilities(mon: int) -> str:
             raise MonitorBossError(f"Could not list information for monitor {mon}") from err
 
 
+# _get_feature and _set_feature expect the monitor to already be open, so that
+# several operations can share a single open/close of the VCP.
+def _get_feature(monitor: VCP, mon: int, feature: VCPCommand, timeout: float) -> VCPFeatureReturn:
+    try:
+        val = monitor.get_vcp_feature(feature, timeout)
+        _log.debug(f"get_vcp_feature for {feature.name} on monitor #{mon} returned {val.value} (max {val.max})")
+        return val
+    except VCPError as err:
+        raise MonitorBossError(f"could not get {feature.name} for monitor #{mon}.") from err
+    except TypeError as err:
+        raise MonitorBossError(f"{feature.name} is not a readable feature.") from err
+
+
+def _set_feature(monitor: VCP, mon: int, feature: VCPCommand, val: int, timeout: float) -> int:
+    try:
+        monitor.set_vcp_feature(feature, val, timeout)
+    except VCPError as err:
+        raise MonitorBossError(f"could not set {feature.name} for monitor #{mon} to {val}.") from err
+    except TypeError as err:
+        raise MonitorBossError(f"{feature.name} is not a writeable feature.") from err
+    except ValueError as err:
+        raise MonitorBossError(f"Provided value ({val}) is above the max for this feature ({feature.name})") from err
+    return val
+
+
 def get_feature(mon: int, feature: VCPCommand, timeout: float) -> VCPFeatureReturn:
     _log.debug(f"get feature: {feature.name} (for monitor #{mon})")
     with get_monitor(mon) as monitor:
-        try:
-            val = monitor.get_vcp_feature(feature, timeout)
-            _log.debug(f"get_vcp_feature for {feature.name} on monitor #{mon} returned {val.value} (max {val.max})")
-            return val
-        except VCPError as err:
-            raise MonitorBossError(f"could not get {feature.name} for monitor #{mon}.") from err
-        except TypeError as err:
-            raise MonitorBossError(f"{feature.name} is not a readable feature.") from err
+        return _get_feature(monitor, mon, feature, timeout)
 
 
 def set_feature(mon: int, feature: VCPCommand, val: int, timeout: float) -> int:
     _log.debug(f"set feature: {feature.name} = {val} (for monitor #{mon})")
     with get_monitor(mon) as monitor:
-        try:
-            monitor.set_vcp_feature(feature, val, timeout)
-        except VCPError as err:
-            raise MonitorBossError(f"could not set {feature.name} for monitor #{mon} to {val}.") from err
-        except TypeError as err:
-            raise MonitorBossError(f"{feature.name} is not a writeable feature.") from err
-        except ValueError as err:
-            raise MonitorBossError(f"Provided value ({val}) is above the max for this feature ({feature.name})") from err
-        return val
+        return _set_feature(monitor, mon, feature, val, timeout)
 
 
 @dataclass
@@ -107,9 +132,10 @@ class ToggledFeature:
 
 def toggle_feature(mon: int, feature: VCPCommand, val1: int, val2: int, timeout: float) -> ToggledFeature:
     _log.debug(f"toggle feature: {feature.name} between {val1} and {val2} (for monitor #{mon})")
-    cur_val = get_feature(mon, feature, timeout).value
-    new_val = val2 if cur_val == val1 else val1
-    set_feature(mon, feature, new_val, timeout)
+    with get_monitor(mon) as monitor:
+        cur_val = _get_feature(monitor, mon, feature, timeout).value
+        new_val = val2 if cur_val == val1 else val1
+        _set_feature(monitor, mon, feature, new_val, timeout)
     return ToggledFeature(cur_val, new_val)
 
 
@@ -119,10 +145,11 @@ def signal_monitor(mon: int):
     timeout = cfg.wait_internal_time
     ddc_wait = cfg.wait_set_time
     visible_wait = max(ddc_wait, 1.0)
-    lum = get_feature(mon, get_vcp_com(VCPCodes.image_luminance), timeout)
+    com = get_vcp_com(Feature.image_luminance.value.code)
+    lum = get_feature(mon, com, timeout)
     sleep(ddc_wait)
-    set_feature(mon, get_vcp_com(VCPCodes.image_luminance), lum.max, timeout)
+    set_feature(mon, com, lum.max, timeout)
     sleep(visible_wait)
-    set_feature(mon, get_vcp_com(VCPCodes.image_luminance), 0, timeout)
+    set_feature(mon, com, 0, timeout)
     sleep(visible_wait)
-    set_feature(mon, get_vcp_com(VCPCodes.image_luminance), lum.code, timeout)
+    set_feature(mon, com, lum.value, timeout)
@@ -1,12 +1,13 @@
 import textwrap
 from dataclasses import dataclass
+from functools import lru_cache
 
 from frozendict import frozendict
 
 from monitorboss import indentation
 from monitorboss.config import Config
 from pyddc import get_vcp_com
-from pyddc.vcp_abc import Capabilities
+from pyddc.vcp_abc import Capabilities, Capability
 from pyddc.vcp_codes import VCPCodes
 
 
@@ -31,10 +32,10 @@ def feature_data(code: int, cfg: Config) -> FeatureData:
     com = get_vcp_com(code)
     if com:
         name = com.name
-        aliases = [alias for alias, val in cfg.feature_aliases.items() if val == com.code]
+        aliases = cfg.feature_aliases_rev.get(com.code, ())
     else:
         name = ""
-        aliases = []
+        aliases = ()
     return FeatureData(name, code, tuple(aliases))
 
 
@@ -54,7 +55,7 @@ class MonitorData:
 
 
 def monitor_data(mon: int, cfg: Config) -> MonitorData:
-    return MonitorData(mon, tuple(alias for alias, val in cfg.monitor_names.items() if mon == val))
+    return MonitorData(mon, tuple(cfg.monitor_names_rev.get(mon, ())))
 
 
 @dataclass(frozen=True)
@@ -75,18 +76,38 @@ class ValueData:
         return f"{self.value} ({' | '.join(data)})" if data else f"{self.value}"
 
 
-def value_data(code: int, value: int, cfg: Config) -> ValueData:
+@lru_cache(maxsize=None)
+def _param_names_rev(code: int) -> dict[int, str]:
+    rev = {}
+    for key, val in get_vcp_com(code).param_names.items():
+        rev.setdefault(val, key)
+    return rev
+
+
+def _value_tables(code: int, cfg: Config) -> tuple[dict[int, str], dict[int, list[str]]]:
+    # the value -> param name and value -> aliases lookups for a feature, resolved once per feature
     com = get_vcp_com(code)
-    param = ""
-    aliases = []
-    if com:
-        for key, val in com.param_names.items():
-            if value == val:
-                param = key
-                break
-        if com.name in cfg.value_aliases:
-            aliases = [alias for alias, val in cfg.value_aliases[com.name].items() if value == val]
-    return ValueData(value, param, tuple(aliases))
+    if not com:
+        return {}, {}
+    return _param_names_rev(com.code), cfg.value_aliases_rev.get(com.name, {})
+
+
+def _value_data(value: int, params: dict[int, str], aliases: dict[int, list[str]]) -> ValueData:
+    if isinstance(value, Capability):
+        # nested capability (see the TODO in capability_data); it can't have a name
+        return ValueData(value, "", ())
+    return ValueData(value, params.get(value, ""), tuple(aliases.get(value, ())))
+
+
+def _capability_values_data(cap: Capability, cfg: Config) -> tuple[ValueData, ...]:
+    if not cap.values:
+        return ()
+    params, aliases = _value_tables(cap.cap, cfg)
+    return tuple(_value_data(v, params, aliases) for v in cap.values)
+
+
+def value_data(code: int, value: int, cfg: Config) -> ValueData:
+    return _value_data(value, *_value_tables(code, cfg))
 
 
 # TODO: do we want PYDDC to be the one to format things in a structure like this, rather than a dict?
@@ -170,10 +191,7 @@ def capability_data(caps: dict[str, Capabilities], cfg) -> CapabilityData:
         for name, cap in caps.items() if name.lower().startswith("cmd")
     })
     vcps = frozendict({
-        name: frozendict({
-            feature_data(f.cap, cfg): tuple(value_data(f.cap, v, cfg) for v in f.values) if f.values else ()
-            for f in cap
-        }) if cap else frozendict()
+        name: frozendict({feature_data(f.cap, cfg): _capability_values_data(f, cfg) for f in cap}) if cap else frozendict()
         for name, cap in caps.items() if name.lower().startswith("vcp")
     })
     info_fields = frozendict({
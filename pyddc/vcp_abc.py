@@ -1,6 +1,9 @@
 from __future__ import annotations
 
 import abc
+import math
+import os
+import re
 from dataclasses import dataclass
 
 from logging import getLogger
@@ -31,6 +34,26 @@ class VCPFeatureReturn:
 VCP_TIMEOUT = 0.04  # at least 40ms per the DDC-CI specification
 
 
+def _sleep_multiplier() -> float:
+    value = os.environ.get("PYDDC_SLEEP_MULT")
+    if value is None:
+        return 1.0
+    try:
+        multiplier = float(value)
+    except ValueError:
+        multiplier = math.nan
+    # time.sleep() rejects negative (and infinite) waits, so don't let them reach the drivers
+    if not (math.isfinite(multiplier) and multiplier >= 0):
+        getLogger(__name__).warning(f"ignoring invalid PYDDC_SLEEP_MULT {value!r}; using 1.0")
+        return 1.0
+    return multiplier
+
+
+# Scales the waits drivers make between writing a DDC-CI request and reading the reply. Monitors that
+# need longer than they are given can set e.g. PYDDC_SLEEP_MULT=2, like ddcutil's --sleep-multiplier.
+SLEEP_MULTIPLIER = _sleep_multiplier()
+
+
 class VCP(abc.ABC):
 
     @abc.abstractmethod # pragma: no cover
@@ -180,11 +203,15 @@ def _parse_caps_hex_list(caps_str: str) -> list[Capability]:
 Capabilities = int | str | list[Capability] | list[int] | dict[str, 'Capabilities']
 
 
+# Some keys have standard meanings and expected value formats.
+# Matched as a (case-insensitive) suffix, since some monitors glue a value onto the front of a key.
+_KNOWN_CAPS_KEYS = re.compile("(" + "|".join(map(re.escape, (
+    'prot', 'cmds', 'vcp', 'type', 'mccs_ver', 'asset_eep', 'mpu_ver', 'model', 'mswhql', 'gamma_table', 'c_tmp_ofst'
+))) + ")$", re.IGNORECASE)
+
+
 def _parse_caps_dict(caps_str: str) -> dict[str, Capabilities]:
     # Data is a series of key-value pairs.
-    # Some keys have standard meanings and expected value formats.
-    known_keys = {'prot', 'cmds', 'vcp', 'type', 'mccs_ver', 'asset_eep', 'mpu_ver', 'model',
-                  'mswhql', 'gamma_table', 'c_tmp_ofst'}
     caps_data = {}
     key = ''
     index = 0
@@ -196,18 +223,17 @@ def _parse_caps_dict(caps_str: str) -> dict[str, Capabilities]:
             # Apple Cinema Display monitors are known to use uppercase "VCP" keys.
             # LG 24UD58 monitors are known to report the "model" value without a key,
             # i.e. "24UD58cmds(...)" instead of "model(24UD58)cmds(...)".
-            for known_key in known_keys:
-                if key.lower().endswith(known_key):
-                    extra, key = key[:-len(known_key)], known_key
-                    if extra:
-                        # Treat the extra prefix as a key with no value
-                        caps_data[extra] = {}
-                    break
+            known_key = _KNOWN_CAPS_KEYS.search(key)
+            if known_key:
+                extra, key = key[:known_key.start()], known_key.group().lower()
+                if extra:
+                    # Treat the extra prefix as a key with no value
+                    caps_data[extra] = {}
             # Some keys' values are expected to be lists of two-digit hexadecimal op-codes:
             # "cmds" lists supported monitor device protocol commands, and "vcp" lists
             # monitor control panel functions (some with associated enumeration values).
             # These keys may have a suffix, e.g. "vcp_p02" or "vcp_p10".
-            if any(key.lower().startswith(k) for k in {'cmds', 'vcp'}):
+            if key.lower().startswith(('cmds', 'vcp')):
                 # Remove all whitespace; it should not be meaningful, and hinders parsing.
                 substr = substr.replace(' ', '').replace('\t', '')
                 value = _parse_caps_hex_list(substr)
@@ -1,5 +1,6 @@
 from dataclasses import dataclass
 from enum import IntEnum, unique
+from functools import lru_cache
 
 
 @unique
@@ -145,6 +146,9 @@ _VCP_COMMANDS = [
 
 # TODO: should this just take a VCPCode, now that we're doing it that way? There are some places this
 #   would make more awkward (see cli._check_feature) but maybe there's a clever way?
+# Memoized because info.py resolves the same few codes once per capability value; typed so that
+# e.g. a float key still raises TypeError instead of hitting the cached int entry.
+@lru_cache(maxsize=None, typed=True)
 def get_vcp_com(key: str | int) -> VCPCommand | None:
     if not isinstance(key, (int, str)):
         raise TypeError(f"key must be string or int. Got {type(key)}.")
@@ -3,9 +3,11 @@
 from __future__ import annotations
 
 from .vcp_codes import VCPCommand
-from .vcp_abc import VCP, VCPIOError, VCPPermissionError, VCPFeatureReturn
+from .vcp_abc import VCP, VCPIOError, VCPPermissionError, VCPFeatureReturn, SLEEP_MULTIPLIER
 from types import TracebackType
 from typing import List, Optional, Type
+from functools import reduce
+from operator import xor
 import os
 import struct
 import sys
@@ -17,6 +19,17 @@ import fcntl
 import pyudev
 
 
+class _HexDump:
+    # Formats bytes for debug logs only if a record is actually emitted, since it is done for every packet.
+    __slots__ = ("data",)
+
+    def __init__(self, data: bytes | bytearray):
+        self.data = data
+
+    def __str__(self) -> str:
+        return self.data.hex(" ").upper()
+
+
 # references:
 # https://github.com/Informatic/python-ddcci
 # https://github.com/siemer/ddcci/
@@ -36,6 +49,7 @@ class LinuxVCP(VCP):
 
     # addresses
     DDCCI_ADDR = 0x37  # DDC-CI command address on the I2C bus
+    DDCCI_WRITE_ADDR = DDCCI_ADDR << 1  # destination byte that request checksums start from
     HOST_ADDRESS = 0x51  # virtual I2C slave address of the host
     I2C_SLAVE = 0x0703  # I2C bus slave address
 
@@ -53,31 +67,34 @@ class LinuxVCP(VCP):
         self.bus_number = bus_number
         self.fd: Optional[int] = None
         self.fp: str = f"/dev/i2c-{self.bus_number}"
-        # time of last feature set call
+        # time of last feature set call (time.monotonic)
         self.last_set: Optional[float] = None
 
     def __enter__(self):
         super().__enter__()
 
-        def cleanup(fd: Optional[int]):
-            if fd is not None:
+        def cleanup():
+            # don't leave a half-opened VCP behind: close the descriptor and leave the context again
+            if self.fd is not None:
                 try:
                     os.close(self.fd)
                 except OSError:
                     pass
+                self.fd = None
+            VCP.__exit__(self, None, None, None)
 
         try:
             self.fd = os.open(self.fp, os.O_RDWR)
             fcntl.ioctl(self.fd, self.I2C_SLAVE, self.DDCCI_ADDR)
             self.read_bytes(1)
         except PermissionError as err:
-            cleanup(self.fd)
+            cleanup()
             raise VCPPermissionError(f"permission error for {self.fp}") from err
         except OSError as err:
-            cleanup(self.fd)
+            cleanup()
             raise VCPIOError(f"unable to open VCP at {self.fp}") from err
         except Exception as err:
-            cleanup(self.fd)
+            cleanup()
             raise err
         return self
 
@@ -91,54 +108,46 @@ class LinuxVCP(VCP):
             os.close(self.fd)
         except OSError as err:
             raise VCPIOError("unable to close descriptor") from err
-        self.fd = None
-        return super().__exit__(exception_type, exception_value, exception_traceback)
+        finally:
+            # the descriptor is unusable either way, so never keep it (or the context) around
+            self.fd = None
+            suppress = super().__exit__(exception_type, exception_value, exception_traceback)
+        return suppress
 
     def _set_vcp_feature(self, com: VCPCommand, value: int, timeout: float):
         del timeout  # unused
         self.rate_limit()
-        # transmission data
-        data = bytearray()
-        data.append(self.SET_VCP_CMD)
-        data.append(com.code)
-        low_byte, high_byte = struct.pack("H", value)
-        data.append(high_byte)
-        data.append(low_byte)
-        # add headers and footers
-        data.insert(0, (len(data) | self.PROTOCOL_FLAG))
-        data.insert(0, self.HOST_ADDRESS)
-        data.append(self.get_checksum(bytearray([self.DDCCI_ADDR << 1]) + data))
+        # transmission data (4 bytes: command, code, value) with headers, then the footer
+        data = bytearray(struct.pack(">BBBBH", self.HOST_ADDRESS, 4 | self.PROTOCOL_FLAG,
+                                     self.SET_VCP_CMD, com.code, value))
+        data.append(self.get_checksum(data, self.DDCCI_WRITE_ADDR))
         # write data
-        self.logger.debug("data=" + " ".join([f"{x:02X}" for x in data]))
+        self.logger.debug("data=%s", _HexDump(data))
         self.write_bytes(data)
         # store time of last set VCP
-        self.last_set = time.time()
+        self.last_set = time.monotonic()
 
     def _get_vcp_feature(self, com: VCPCommand, timeout: float) -> VCPFeatureReturn:
         self.rate_limit()
-        # transmission data
-        data = bytearray()
-        data.append(self.GET_VCP_CMD)
-        data.append(com.code)
-        # add headers and footers
-        data.insert(0, (len(data) | self.PROTOCOL_FLAG))
-        data.insert(0, self.HOST_ADDRESS)
-        data.append(self.get_checksum(bytearray([self.DDCCI_ADDR << 1]) + data))
+        # transmission data (2 bytes: command, code) with headers, then the footer
+        data = bytearray(struct.pack(">BBBB", self.HOST_ADDRESS, 2 | self.PROTOCOL_FLAG,
+                                     self.GET_VCP_CMD, com.code))
+        data.append(self.get_checksum(data, self.DDCCI_WRITE_ADDR))
         # write data
-        self.logger.debug("data=" + " ".join([f"{x:02X}" for x in data]))
+        self.logger.debug("data=%s", _HexDump(data))
         self.write_bytes(data)
         # wait
-        time.sleep(timeout)
+        time.sleep(timeout * SLEEP_MULTIPLIER)
         # read the data
         header = self.read_bytes(self.GET_VCP_HEADER_LENGTH)
-        self.logger.debug("header=" + " ".join([f"{x:02X}" for x in header]))
+        self.logger.debug("header=%s", _HexDump(header))
         source, length = struct.unpack("=BB", header)
         length &= ~self.PROTOCOL_FLAG  # clear protocol flag
         payload = self.read_bytes(length + 1)
-        self.logger.debug("payload=" + " ".join([f"{x:02X}" for x in payload]))
+        self.logger.debug("payload=%s", _HexDump(payload))
         # check checksum
         payload, checksum = struct.unpack(f"={length}sB", payload)
-        calculated_checksum = self.get_checksum(header + payload)
+        calculated_checksum = self.get_checksum(payload, self.get_checksum(header))
         checksum_xor = checksum ^ calculated_checksum
         if checksum_xor:
             message = f"checksum does not match: {checksum_xor}"
@@ -169,8 +178,8 @@ class LinuxVCP(VCP):
         return VCPFeatureReturn(feature_current, feature_max)
 
     def _get_vcp_capabilities_str(self, timeout: float) -> str:
-        # Create an empty capabilities string to be filled with the data
-        caps_str = ""
+        # Create an empty buffer to be filled with the data; it's decoded once at the end
+        caps_bytes = bytearray()
         self.rate_limit()
         # Get the first 32B of capabilities string
         offset = 0
@@ -179,33 +188,27 @@ class LinuxVCP(VCP):
         loop_count_limit = 40
         while loop_count < loop_count_limit:
             loop_count += 1
-            # transmission data
-            data = bytearray()
-            data.append(self.GET_VCP_CAPS_CMD)
-            low_byte, high_byte = struct.pack("H", offset)
-            data.append(high_byte)
-            data.append(low_byte)
-            # add headers and footers
-            data.insert(0, (len(data) | self.PROTOCOL_FLAG))
-            data.insert(0, self.HOST_ADDRESS)
-            data.append(self.get_checksum(data))
+            # transmission data (3 bytes: command, offset) with headers, then the footer
+            data = bytearray(struct.pack(">BBBH", self.HOST_ADDRESS, 3 | self.PROTOCOL_FLAG,
+                                         self.GET_VCP_CAPS_CMD, offset))
+            data.append(self.get_checksum(data, self.DDCCI_WRITE_ADDR))
             # write data
             self.write_bytes(data)
             # wait
-            time.sleep(timeout)
+            time.sleep(timeout * SLEEP_MULTIPLIER)
             # read the data
             header = self.read_bytes(self.GET_VCP_HEADER_LENGTH)
-            self.logger.debug("header=" + " ".join([f"{x:02X}" for x in header]))
+            self.logger.debug("header=%s", _HexDump(header))
             source, length = struct.unpack("BB", header)
             length &= ~self.PROTOCOL_FLAG  # clear protocol flag
             payload = self.read_bytes(length + 1)
-            self.logger.debug("payload=" + " ".join([f"{x:02X}" for x in payload]))
+            self.logger.debug("payload=%s", _HexDump(payload))
             # check if length is valid
             if length < 3 or length > 35:
                 raise VCPIOError(f"received unexpected response length: {length}")
             # check checksum
             payload, checksum = struct.unpack(f"{length}sB", payload)
-            calculated_checksum = self.get_checksum(header + payload)
+            calculated_checksum = self.get_checksum(payload, self.get_checksum(header))
             checksum_xor = checksum ^ calculated_checksum
             if checksum_xor:
                 message = f"checksum does not match: {checksum_xor}"
@@ -222,26 +225,27 @@ class LinuxVCP(VCP):
             offset, payload = struct.unpack(f">H{length - 2}s", payload)
             length -= 2
             if length > 0:
-                caps_str += payload.decode("ascii")
+                caps_bytes += payload
             else:
                 break
             # update the offset and go again
             offset += length
-        self.logger.debug(f"caps str={caps_str}")
+        caps_str = caps_bytes.decode("ascii")
+        self.logger.debug("caps str=%s", caps_str)
         if loop_count >= loop_count_limit:
             raise VCPIOError("Capabilities string incomplete or too long")
         return caps_str
 
     @staticmethod
-    def get_checksum(data: bytearray) -> int:
-        checksum = 0x00
-        for data_byte in data:
-            checksum ^= data_byte
-        return checksum
+    def get_checksum(data: bytes | bytearray, initial: int = 0x00) -> int:
+        # XOR fold done by reduce in C rather than byte by byte in the interpreter; initial lets
+        # callers fold in a leading byte or an earlier part of the message without concatenating
+        return reduce(xor, data, initial)
 
     def rate_limit(self):
         if self.last_set is not None:
-            rate_delay = self.CMD_RATE - time.time() - self.last_set
+            # only wait out whatever is left of the minimum gap since the last set
+            rate_delay = self.CMD_RATE - (time.monotonic() - self.last_set)
             if rate_delay > 0:
                 time.sleep(rate_delay)
 
@@ -257,17 +261,23 @@ class LinuxVCP(VCP):
         except OSError as err:
             raise VCPIOError("unable write to I2C bus") from err
 
+    @staticmethod
+    def _probe(bus_number: int) -> Optional[LinuxVCP]:
+        vcp = LinuxVCP(bus_number)
+        try:
+            with vcp:
+                pass
+        except (OSError, VCPIOError):
+            return None
+        return vcp
+
     @staticmethod
     def get_vcps() -> List[LinuxVCP]:
-        vcps = []
         # iterate I2C devices
-        for device in pyudev.Context().list_devices(subsystem="i2c"):
-            vcp = LinuxVCP(device.sys_number)
-            try:
-                with vcp:
-                    pass
-            except (OSError, VCPIOError):
-                pass
-            else:
-                vcps.append(vcp)
-        return vcps
+        bus_numbers = [device.sys_number for device in pyudev.Context().list_devices(subsystem="i2c")]
+        # Each bus is a separate device, and probing one mostly waits on I/O, so probe them concurrently.
+        # map() keeps the enumeration order, which the monitor indices depend on.
+        # (imported here rather than at module level, since it's slow to import and only needed here)
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor() as executor:
+            return [vcp for vcp in executor.map(LinuxVCP._probe, bus_numbers) if vcp is not None]
@@ -8,6 +8,7 @@ from test.pyddc.vcp_dummy import DummyVCP as VCP
 import pyddc
 pyddc.VCP = VCP
 from monitorboss import cli, MonitorBossError
+from monitorboss.config import Config
 
 
 class TestCheckAttribute:
@@ -21,6 +22,10 @@ class TestCheckAttribute:
     def test_check_attr_int_valid(self, test_cfg):
         assert cli._check_feature(f"{VCPCodes.input_source.value}", test_cfg) == get_vcp_com(VCPCodes.input_source.value)
 
+    def test_check_attr_superscript_invalid(self, test_cfg):
+        with pytest.raises(MonitorBossError):
+            cli._check_feature("1\u00b2", test_cfg)
+
     def test_check_attr_namealias_invalid(self, test_cfg):
         with pytest.raises(MonitorBossError):
             cli._check_feature("foo", test_cfg)
@@ -45,11 +50,41 @@ class TestCheckMonitor:
         assert cli._check_mon("8", test_cfg) == 8
 
 
+class TestForEachMonitor:
+
+    def test_for_each_monitor_serial(self, test_cfg):
+        assert cli._for_each_monitor(lambda m: m * 2, [0, 1, 2], 0, test_cfg) == [0, 2, 4]
+
+    def test_for_each_monitor_single(self):
+        cfg = Config(parallel=True)
+        assert cli._for_each_monitor(lambda m: m * 2, [1], 0, cfg) == [2]
+
+    def test_for_each_monitor_parallel(self, monkeypatch):
+        waits = []
+        monkeypatch.setattr(cli, "sleep", waits.append)
+        cfg = Config(parallel=True)
+        assert cli._for_each_monitor(lambda m: m * 2, [2, 0, 1], 0, cfg) == [4, 0, 2]
+        assert waits == []
+
+    @pytest.mark.parametrize("mons", [[0, 0], [2, -1]])
+    def test_for_each_monitor_parallel_same_monitor(self, monkeypatch, mons):
+        # the same VCP can't be opened twice at once, so these must run serially
+        waits = []
+        monkeypatch.setattr(cli, "sleep", waits.append)
+        cfg = Config(parallel=True)
+        assert cli._for_each_monitor(lambda m: m, mons, 0.5, cfg) == mons
+        assert waits == [0.5]
+
+
 class TestCheckValue:
 
     def test_check_val_digits(self, test_cfg):
         assert cli._check_val(get_vcp_com(VCPCodes.input_source), "5", test_cfg) == 5
 
+    def test_check_val_superscript_invalid(self, test_cfg):
+        with pytest.raises(MonitorBossError):
+            cli._check_val(get_vcp_com(VCPCodes.image_luminance), "1\u00b2", test_cfg)
+
     def test_check_val_param(self, test_cfg):
         assert cli._check_val(get_vcp_com(VCPCodes.input_source), "dp1", test_cfg) == 15
 
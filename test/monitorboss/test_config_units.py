@@ -1,6 +1,10 @@
+from dataclasses import fields
+
+import pytest
 import tomlkit
 
-from monitorboss import config
+from monitorboss import config, MonitorBossError
+from test.pyddc import TEST_TOML_CONTENTS
 
 
 # TODO: test reading, parsing, and validating of config
@@ -27,5 +31,51 @@ def test_config_reset(pytester):
         contents = file.read()
     assert contents == tomlkit.dumps(config.default_toml())
 
+
+def test_config_cached(pytester):
+    confpath = pytester.path.joinpath("test_config.toml").as_posix()
+    cfg = config.get_config(confpath)
+    assert config.get_config(confpath) is cfg
+    config.reset_config(confpath)
+    assert config.get_config(confpath) is not cfg
+
+
+def test_config_reset_cached_matches_file(pytester):
+    confpath = pytester.path.joinpath("test_config.toml").as_posix()
+    config.reset_config(confpath)
+    assert config.get_config(confpath) == config._load_config(confpath)
+
+
+def test_config_write_updates_cache(pytester):
+    confpath = pytester.path.joinpath("test_config.toml").as_posix()
+    config.get_config(confpath)
+    config.set_wait_get_time(0.5, confpath)
+    assert config.get_config(confpath).wait_get_time == 0.5
+
+
+def test_config_nonnumeric_value_key(pytester):
+    conf = pytester.makefile(".toml", test_toml=TEST_TOML_CONTENTS.replace('17 = "hdmi"', 'seventeen = "hdmi"'))
+    with pytest.raises(MonitorBossError, match="expected a numeric key, got 'seventeen'"):
+        config.get_config(conf.as_posix())
+
+
+def test_config_nonnumeric_monitor_key(pytester):
+    conf = pytester.makefile(".toml", test_toml=TEST_TOML_CONTENTS.replace('0 = "foo"', 'zero = "foo"'))
+    with pytest.raises(MonitorBossError, match="expected a numeric key, got 'zero'"):
+        config.get_config(conf.as_posix())
+
+
+def test_config_reverse_lookups_direct():
+    cfg = config.Config(monitor_names={"foo": 0, "bar": 1, "baz": 1}, value_aliases={"input_source": {"hdmi": 17}})
+    assert cfg.monitor_names_rev == {0: ["foo"], 1: ["bar", "baz"]}
+    assert cfg.value_aliases_rev == {"input_source": {17: ["hdmi"]}}
+    assert "_rev" not in repr(cfg)
+
+
+def test_config_reverse_lookups_read(test_cfg):
+    assert test_cfg.monitor_names_rev[1] == ["bar", "baz"]
+    assert test_cfg == config.Config(**{f.name: getattr(test_cfg, f.name) for f in fields(test_cfg) if f.init})
+
+
 # TODO: should probably eventually test more of the config functions,
 #   but we're currently not even using them and they might change, so not bothering yet
@@ -13,3 +13,19 @@ def test_impl_get_monitor_invalid():
     #     impl._get_monitor(-1)
     with pytest.raises(MonitorBossError):
         impl.get_monitor(3)
+
+
+def test_impl_get_monitor_cached():
+    impl.clear_monitor_cache()
+    monitor = impl.get_monitor(1)
+    assert impl.get_monitor(1) is monitor
+    impl.clear_monitor_cache()
+    assert impl.get_monitor(1) is not monitor
+
+
+def test_impl_get_vcp_capabilities_cleared_with_monitors():
+    impl.clear_monitor_cache()
+    impl.get_vcp_capabilities(1)
+    assert impl.get_vcp_capabilities.cache_info().currsize == 1
+    impl.clear_monitor_cache()
+    assert impl.get_vcp_capabilities.cache_info().currsize == 0
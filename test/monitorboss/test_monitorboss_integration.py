@@ -58,6 +58,23 @@ def test_caps_full_human(test_conf_file, test_cfg, capsys):
     assert capture.err == ""
     
     
+def test_caps_rerun_sees_new_hardware(test_conf_file, test_cfg, capsys, monkeypatch):
+    cli.run(f"--config {test_conf_file.as_posix()} caps --raw 0")
+    capsys.readouterr()
+    # a different monitor now shows up at index 0, which the next command must see
+    new_template = vcp_dummy.VCPTemplate([], "(prot(monitor)type(LCD)model(NEW1)vcp(10)mccs_ver(2.1))", False)
+    monkeypatch.setattr(vcp_dummy, "vcp_template_list", [new_template] + vcp_dummy.vcp_template_list[1:])
+    expected = output.caps_raw_output([(mdata0, new_template.caps_str)], False) + "\n"
+    try:
+        cli.run(f"--config {test_conf_file.as_posix()} caps --raw 0")
+        capture = capsys.readouterr()
+        assert capture.out == expected
+        assert capture.err == ""
+    finally:
+        # don't leave the swapped-in monitor cached for later tests
+        impl.clear_monitor_cache()
+
+
 def test_caps_full_json(test_conf_file, test_cfg, capsys):
     caps = info.capability_data(parse_capabilities(impl.get_vcp_capabilities(0)), test_cfg)
     expected = output.caps_parsed_output([(mdata0, caps)], True) + "\n"
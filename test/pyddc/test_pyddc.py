@@ -1,6 +1,6 @@
 import pytest
 
-from pyddc import get_vcp_com, parse_capabilities, vcp_codes
+from pyddc import get_vcp_com, parse_capabilities, vcp_abc, vcp_codes
 from pyddc.vcp_codes import VCPCodes
 from .vcp_dummy import VCPTemplate, SupportedCodeTemplate, DummyVCP as VCP
 
@@ -132,6 +132,27 @@ class TestCapabilitiesFunctions:
         assert str(caps) == "{'prot': 'monitor', 'type': 'LCD', 'model': 'DUMM13', 'cmds': [Capability(cap=4, values=None)], 'vcp': [Capability(cap=16, values=None), Capability(cap=96, values=[1, 15, 17])], 'mccs_ver': '2.1'}"
 
 
+class TestSleepMultiplier:
+
+    def test_sleep_mult_default(self, monkeypatch):
+        monkeypatch.delenv("PYDDC_SLEEP_MULT", raising=False)
+        assert vcp_abc._sleep_multiplier() == 1.0
+
+    def test_sleep_mult_valid(self, monkeypatch):
+        monkeypatch.setenv("PYDDC_SLEEP_MULT", "2.5")
+        assert vcp_abc._sleep_multiplier() == 2.5
+
+    def test_sleep_mult_not_a_number(self, monkeypatch, caplog):
+        monkeypatch.setenv("PYDDC_SLEEP_MULT", "fast")
+        assert vcp_abc._sleep_multiplier() == 1.0
+        assert "PYDDC_SLEEP_MULT" in caplog.text
+
+    def test_sleep_mult_negative(self, monkeypatch, caplog):
+        monkeypatch.setenv("PYDDC_SLEEP_MULT", "-1")
+        assert vcp_abc._sleep_multiplier() == 1.0
+        assert "PYDDC_SLEEP_MULT" in caplog.text
+
+
 class TestVCPCommands:
 
     # The number of items in VCPCodes(IntEnum) and _VCP_COMMANDS should always match
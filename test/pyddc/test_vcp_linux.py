@@ -0,0 +1,172 @@
+import sys
+import time
+
+import pytest
+
+if not sys.platform.startswith("linux"):
+    pytest.skip("the Linux driver can only be imported on Linux", allow_module_level=True)
+pytest.importorskip("pyudev")
+
+from pyddc import get_vcp_com, vcp_linux, VCPIOError, VCPPermissionError
+from pyddc.vcp_codes import VCPCodes
+from pyddc.vcp_linux import LinuxVCP
+
+lum_command = get_vcp_com(VCPCodes.image_luminance)
+
+
+class _Device:
+    def __init__(self, sys_number: int):
+        self.sys_number = sys_number
+
+
+class _Context:
+    def __init__(self, bus_numbers: list[int]):
+        self.bus_numbers = bus_numbers
+
+    def list_devices(self, subsystem: str):
+        assert subsystem == "i2c"
+        return [_Device(n) for n in self.bus_numbers]
+
+
+class TestGetVCPs:
+
+    def test_get_vcps_order_and_filter(self, monkeypatch):
+        monkeypatch.setattr(vcp_linux.pyudev, "Context", lambda: _Context([5, 1, 3, 2, 4]))
+        def probe(bus):
+            # finish out of order (earlier buses take longer); odd buses have a monitor, even ones fail to open
+            time.sleep(bus * 0.01)
+            return LinuxVCP(bus) if bus % 2 else None
+
+        monkeypatch.setattr(LinuxVCP, "_probe", staticmethod(probe))
+        assert [vcp.bus_number for vcp in LinuxVCP.get_vcps()] == [5, 1, 3]
+
+    def test_get_vcps_none(self, monkeypatch):
+        monkeypatch.setattr(vcp_linux.pyudev, "Context", lambda: _Context([]))
+        assert LinuxVCP.get_vcps() == []
+
+
+class TestHexDump:
+
+    def test_hex_dump_str(self):
+        assert str(vcp_linux._HexDump(b"\x51\x82\x01\x10\xac")) == "51 82 01 10 AC"
+
+    def test_hex_dump_lazy(self, monkeypatch):
+        formatted = []
+        monkeypatch.setattr(vcp_linux._HexDump, "__str__", lambda self: formatted.append(self) or "")
+        vcp = LinuxVCP(0)
+        monkeypatch.setattr(vcp.logger, "isEnabledFor", lambda level: False)
+        vcp.logger.debug("data=%s", vcp_linux._HexDump(b"\x00"))
+        assert formatted == []
+
+
+# Requests are: source (0x51), length | 0x80, payload, then a checksum that XORs the destination
+# byte (0x6E) with every byte before it, per the DDC/CI framing.
+class TestRequestPackets:
+
+    @pytest.fixture
+    def vcp(self, monkeypatch):
+        vcp = LinuxVCP(0)
+        vcp.written = []
+        monkeypatch.setattr(vcp, "write_bytes", lambda data: vcp.written.append(bytes(data)))
+        monkeypatch.setattr(vcp_linux.time, "sleep", lambda secs: None)
+        return vcp
+
+    def test_set_packet(self, vcp):
+        vcp._set_vcp_feature(lum_command, 50, 0)
+        assert vcp.written == [bytes.fromhex("51 84 03 10 00 32 9A")]
+
+    def test_get_packet(self, vcp, monkeypatch):
+        # reply: luminance 50 out of 100
+        replies = [bytes.fromhex("6E 88"), bytes.fromhex("02 00 10 00 00 64 00 32 00")]
+        monkeypatch.setattr(vcp, "read_bytes", lambda num_bytes: replies.pop(0))
+        ret = vcp._get_vcp_feature(lum_command, 0)
+        assert vcp.written == [bytes.fromhex("51 82 01 10 AC")]
+        assert (ret.value, ret.max) == (50, 100)
+
+    def test_caps_packet(self, vcp, monkeypatch):
+        # one chunk of "(vcp(10))", then an empty chunk to end the string; requests are for offsets 0 and 9
+        replies = [bytes.fromhex("6E 8C"), bytes.fromhex("E3 00 00") + b"(vcp(10))" + bytes(1),
+                   bytes.fromhex("6E 83"), bytes.fromhex("E3 00 09 00")]
+        monkeypatch.setattr(vcp, "read_bytes", lambda num_bytes: replies.pop(0))
+        assert vcp._get_vcp_capabilities_str(0) == "(vcp(10))"
+        assert vcp.written == [bytes.fromhex("51 83 F3 00 00 4F"), bytes.fromhex("51 83 F3 00 09 46")]
+
+
+class TestRateLimit:
+
+    @pytest.fixture
+    def clock(self, monkeypatch):
+        clock = {"now": 100.0, "slept": []}
+        monkeypatch.setattr(vcp_linux.time, "monotonic", lambda: clock["now"])
+        monkeypatch.setattr(vcp_linux.time, "sleep", lambda secs: clock["slept"].append(secs))
+        return clock
+
+    def test_rate_limit_no_set(self, clock):
+        LinuxVCP(0).rate_limit()
+        assert clock["slept"] == []
+
+    def test_rate_limit_right_after_set(self, clock):
+        vcp = LinuxVCP(0)
+        vcp.last_set = clock["now"]
+        vcp.rate_limit()
+        assert clock["slept"] == [pytest.approx(LinuxVCP.CMD_RATE)]
+
+    def test_rate_limit_remaining_time(self, clock):
+        vcp = LinuxVCP(0)
+        vcp.last_set = clock["now"] - 0.03
+        vcp.rate_limit()
+        assert clock["slept"] == [pytest.approx(LinuxVCP.CMD_RATE - 0.03)]
+
+    def test_rate_limit_elapsed(self, clock):
+        # more than CMD_RATE (50ms) has passed since the last set
+        vcp = LinuxVCP(0)
+        vcp.last_set = clock["now"] - 0.06
+        vcp.rate_limit()
+        assert clock["slept"] == []
+
+
+class TestContextManager:
+
+    @pytest.fixture
+    def closed(self, monkeypatch):
+        closed = []
+        monkeypatch.setattr(vcp_linux.os, "open", lambda path, flags: 42)
+        monkeypatch.setattr(vcp_linux.os, "close", closed.append)
+        return closed
+
+    def test_enter_ioctl_fails(self, closed, monkeypatch):
+        def ioctl(fd, request, arg):
+            raise OSError("no such device")
+
+        monkeypatch.setattr(vcp_linux.fcntl, "ioctl", ioctl)
+        vcp = LinuxVCP(0)
+        with pytest.raises(VCPIOError):
+            vcp.__enter__()
+        assert closed == [42]
+        assert vcp.fd is None
+        assert vcp._in_ctx is False
+
+    def test_enter_permission_denied(self, closed, monkeypatch):
+        def os_open(path, flags):
+            raise PermissionError(path)
+
+        monkeypatch.setattr(vcp_linux.os, "open", os_open)
+        vcp = LinuxVCP(0)
+        with pytest.raises(VCPPermissionError):
+            vcp.__enter__()
+        assert closed == []
+        assert vcp.fd is None
+        assert vcp._in_ctx is False
+
+    def test_exit_close_fails(self, monkeypatch):
+        def os_close(fd):
+            raise OSError("bad descriptor")
+
+        monkeypatch.setattr(vcp_linux.os, "close", os_close)
+        vcp = LinuxVCP(0)
+        vcp.fd = 42
+        vcp._in_ctx = True
+        with pytest.raises(VCPIOError):
+            vcp.__exit__(None, None, None)
+        assert vcp.fd is None
+        assert vcp._in_ctx is False
@@ -45,13 +45,17 @@ class SupportedCodeTemplate:
 
 
 class VCPTemplate:
-    supported_codes: dict[int, list[int] | None] = {}
-    current_values: dict[int, int] = {}
-    unknown_max_values: dict[int, int] = {}
+    supported_codes: dict[int, list[int] | None]
+    current_values: dict[int, int]
+    unknown_max_values: dict[int, int]
     caps_str: str
     faulty: bool  # for tests where you want the VCP operations to fail with a VCPError
 
     def __init__(self, supported_codes: list[SupportedCodeTemplate], caps_str: str, faulty: bool):
+        # per-template tables; as class attributes these were shared (and mutated) by every template
+        self.supported_codes = {}
+        self.current_values = {}
+        self.unknown_max_values = {}
         for code in supported_codes:
             self.supported_codes[code.code] = code.supported_params
             if code.initial_value: